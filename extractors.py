@@ -0,0 +1,559 @@
+"""CV dosyalarından metin çıkarma yardımcıları.
+
+Bu modül Streamlit'e bağımlı değildir: süreç havuzundaki işçiler yalnızca bu modülü
+içe aktarır, uygulama betiğini (app.py) yeniden çalıştırmaz.
+"""
+import argparse
+import itertools
+import os
+import re
+import sys
+import time
+import tracemalloc
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
+
+import PyPDF2
+import docx
+from docx.oxml.ns import qn
+
+# pdfminer.six isteğe bağlıdır; kurulu değilse düzen duyarlı PDF backend'i devre dışı kalır
+try:
+    from pdfminer.high_level import extract_pages as pdfminer_extract_pages
+    from pdfminer.layout import LAParams, LTTextContainer
+    from pdfminer.pdfpage import PDFPage
+except ImportError:
+    pdfminer_extract_pages = None
+
+# bytes, bytearray, memoryview veya başa sarılabilen dosya nesnesi (ör. Streamlit UploadedFile)
+Source = Union[bytes, bytearray, memoryview, BinaryIO]
+
+def open_stream(source: Source) -> BinaryIO:
+    """Kaynağı okunabilir akışa çevirir; dosya nesneleri kopyalanmadan başa sarılır"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        # bytes ile oluşturulan BytesIO tamponu yazılana kadar paylaşır, kopyalamaz
+        return BytesIO(source)
+    source.seek(0)
+    return source
+
+def read_bytes(source: Source) -> bytes:
+    """Süreç havuzuna gönderilecek kaynağın bytes halini döndürür (yalnızca gerektiğinde kopyalar)"""
+    if isinstance(source, bytes):
+        return source
+    if isinstance(source, (bytearray, memoryview)):
+        return bytes(source)
+    if hasattr(source, "getvalue"):
+        return source.getvalue()
+    source.seek(0)
+    return source.read()
+
+PAGE_RANGE_TIMEOUT = 60.0  # Paralel çıkarmada bir sayfa aralığı sonucunun beklenebileceği en uzun süre (sn)
+
+# PDF temizleme ayarları
+EDGE_LINES = 3  # Sayfa başı/sonunda üst-alt bilgi adayı sayılan satır sayısı
+REPEATED_LINE_MIN_RATIO = 0.5  # Bir satırın tekrar sayılması için geçmesi gereken sayfa oranı
+CHARS_PER_TOKEN = 4  # Token tahmini için ortalama karakter sayısı
+
+YEAR_RANGE = range(1900, 2101)  # Bu aralıktaki sayılar açık sayfa işareti olmadan sayfa numarası sayılmaz
+
+# "Sayfa 3", "Page 2 of 5", "s. 4": etiketli sayfa numarası
+PAGE_LABEL_PATTERN = re.compile(
+    r'^\s*(?:sayfa|page|s\.|p\.)\s*[-–]?\s*\d{1,4}(?:\s*(?:/|of)\s*\d{1,4})?\s*[-–]?\s*$', re.IGNORECASE
+)
+# "3/5", "2 of 4": toplam sayfa sayısı belgeninkiyle tutmalı ("09/2019" gibi tarihler elenir)
+PAGE_FRACTION_PATTERN = re.compile(r'^\s*[-–]?\s*(\d{1,4})\s*(?:/|of)\s*(\d{1,4})\s*[-–]?\s*$', re.IGNORECASE)
+# "7", "- 7 -": yalnızca sayfalar boyunca ardışık dizi oluşturuyorsa sayfa numarasıdır
+BARE_NUMBER_PATTERN = re.compile(r'^\s*[-–]?\s*(\d{1,4})\s*[-–]?\s*$')
+# Satır içindeki sayfa işareti; "09/2019", "01/05/2020" gibi tarihler işaret sayılmaz
+PAGE_MARKER_PATTERN = re.compile(
+    r'(?:sayfa|page)\s*\d|(?<![\d/.])\d{1,3}\s*(?:/|of)\s*\d{1,3}(?![\d/.])', re.IGNORECASE
+)
+HYPHENATION_PATTERN = re.compile(r'([^\W\d_]{2,})[-‐\u00ad]\n[ \t]*([^\W\d_]+)')
+INVISIBLE_CHARS = str.maketrans({"\u00ad": None, "\u200b": None, "\ufeff": None, "\x00": None, "\x0c": "\n"})
+HORIZONTAL_SPACE_PATTERN = re.compile(r'[ \t\u00a0]+')
+BLANK_LINES_PATTERN = re.compile(r'\n{3,}')
+
+def estimate_tokens(text: str) -> int:
+    """Model token sayısının kaba tahmini"""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+def _line_signature(line: str) -> str:
+    """Tekrar tespiti için satır imzası; sayfa işareti içeren satırlarda değişen rakamlar yok sayılır"""
+    signature = HORIZONTAL_SPACE_PATTERN.sub(' ', line).strip().lower()
+    if PAGE_MARKER_PATTERN.search(signature):
+        signature = re.sub(r'\d+', '#', signature)
+    return signature
+
+def _join_hyphenations(text: str) -> Tuple[str, int]:
+    """Satır sonunda tirele bölünmüş kelimeleri birleştirir (sonraki parça küçük harfle başlıyorsa)"""
+    return HYPHENATION_PATTERN.subn(
+        lambda match: match.group(1) + match.group(2) if match.group(2)[0].islower() else match.group(0), text
+    )
+
+def _is_marked_page_number(line: str, page_count: int) -> bool:
+    """Etiketli ("Sayfa 3") veya belgenin sayfa sayısıyla tutan kesirli ("3/5") sayfa numarası mı"""
+    if PAGE_LABEL_PATTERN.match(line):
+        return True
+    fraction = PAGE_FRACTION_PATTERN.match(line)
+    if fraction:
+        number, total = int(fraction.group(1)), int(fraction.group(2))
+        return 1 <= number <= total == page_count
+    return False
+
+def _sequence_page_numbers(pages: List[List[str]], edges: List[set]) -> set:
+    """Sayfa kenarlarındaki yalın sayılardan sayfa sırasıyla artan diziyi (n, n+1, ...) bulur.
+
+    (sayfa, satır) çiftlerini döndürür. Tek sayfalık belgelerde ve yıl aralığındaki sayılarda
+    hiçbir satır sayfa numarası sayılmaz; bunlar çoğunlukla CV'deki tarihlerdir.
+    """
+    if len(pages) < 2:
+        return set()
+    candidates = {}  # sayfa numarası ile sayfa sırası arasındaki fark -> {(sayfa, satır)}
+    for page_number, (lines, indexes) in enumerate(zip(pages, edges)):
+        for index in indexes:
+            match = BARE_NUMBER_PATTERN.match(lines[index])
+            if match and int(match.group(1)) not in YEAR_RANGE:
+                candidates.setdefault(int(match.group(1)) - page_number, set()).add((page_number, index))
+    min_pages = max(2, int(len(pages) * REPEATED_LINE_MIN_RATIO + 0.5))
+    found = set()
+    for lines in candidates.values():
+        if len({page_number for page_number, _ in lines}) >= min_pages:
+            found |= lines
+    return found
+
+def clean_pdf_pages(page_texts: List[str], page_count: Optional[int] = None) -> Tuple[str, Dict]:
+    """PDF sayfalarındaki yerleşim artıklarını temizler.
+
+    Sayfaların baş/son satırlarında çoğu sayfada tekrarlanan üst-alt bilgileri ve sayfa
+    numaralarını atar, satır sonunda tirele bölünmüş kelimeleri birleştirir, boşlukları
+    sadeleştirir. `page_count` belgenin toplam sayfa sayısıdır (varsayılan: verilen sayfalar).
+    Temiz metni ve kazanım istatistiklerini döndürür.
+    """
+    page_count = page_count or len(page_texts)
+    original_chars = sum(len(text) + 1 for text in page_texts)
+    # Tirele bölünmüş kelimeler önce birleştirilir; parçaları ayrı satır sayılıp tekrar sanılmasın
+    joined_hyphenations = 0
+    pages = []
+    for page_text in page_texts:
+        page_text, joined = _join_hyphenations(page_text.translate(INVISIBLE_CHARS))
+        joined_hyphenations += joined
+        pages.append(page_text.split("\n"))
+
+    # Üst-alt bilgi adayları: her sayfanın ilk ve son dolu satırları
+    def edge_indexes(lines):
+        filled = [index for index, line in enumerate(lines) if line.strip()]
+        # Kısa sayfalarda içeriğin tamamı aday sayılmasın: en fazla satırların dörtte biri
+        count = min(EDGE_LINES, max(1, len(filled) // 4))
+        return set(filled[:count] + filled[-count:])
+
+    edges = [edge_indexes(lines) for lines in pages]
+    repeated = set()
+    if len(pages) >= 2:
+        signature_pages = {}
+        for page_number, (lines, indexes) in enumerate(zip(pages, edges)):
+            for index in indexes:
+                # Yalın sayılar (sayfa numarası ya da yıl) tekrar sayılmaz, dizi kontrolüne kalır
+                if not BARE_NUMBER_PATTERN.match(lines[index]):
+                    signature_pages.setdefault(_line_signature(lines[index]), set()).add(page_number)
+        min_pages = max(2, int(len(pages) * REPEATED_LINE_MIN_RATIO + 0.5))
+        repeated = {signature for signature, found in signature_pages.items() if signature and len(found) >= min_pages}
+
+    sequence_numbers = _sequence_page_numbers(pages, edges)
+    removed_repeated = 0
+    removed_page_numbers = 0
+    cleaned_pages = []
+    for page_number, (lines, indexes) in enumerate(zip(pages, edges)):
+        kept = []
+        for index, line in enumerate(lines):
+            if index in indexes:
+                if _line_signature(line) in repeated:
+                    removed_repeated += 1
+                    continue
+                if (page_number, index) in sequence_numbers or _is_marked_page_number(line, page_count):
+                    removed_page_numbers += 1
+                    continue
+            kept.append(HORIZONTAL_SPACE_PATTERN.sub(" ", line).strip())
+        cleaned_pages.append("\n".join(kept))
+
+    # Sayfa sınırında bölünen kelimeler üst-alt bilgiler atıldıktan sonra birleşir
+    text, joined = _join_hyphenations("\n".join(cleaned_pages))
+    joined_hyphenations += joined
+    text = BLANK_LINES_PATTERN.sub("\n\n", text).strip() + "\n"
+
+    saved_chars = max(0, original_chars - len(text))
+    return text, {
+        "original_chars": original_chars,
+        "cleaned_chars": len(text),
+        "saved_chars": saved_chars,
+        "saved_tokens": max(0, -(-original_chars // CHARS_PER_TOKEN) - estimate_tokens(text)),
+        "removed_repeated_lines": removed_repeated,
+        "removed_page_numbers": removed_page_numbers,
+        "joined_hyphenations": joined_hyphenations
+    }
+
+def _join_capped(texts, max_chars: Optional[int]) -> Tuple[str, bool]:
+    """Metin parçalarını satır sonlarıyla birleştirir; üst sınır aşılırsa keser"""
+    text = "".join(part + "\n" for part in texts)
+    if max_chars is not None and len(text) > max_chars:
+        return text[:max_chars], True
+    return text, False
+
+def _extract_page_range(data: bytes, start: int, stop: int) -> List[Tuple[int, str, float]]:
+    """İşçi süreçte çalışır: [start, stop) aralığındaki sayfaların metnini ve çıkarma sürelerini döndürür"""
+    reader = PyPDF2.PdfReader(BytesIO(data))
+    pages = []
+    for number in range(start, stop):
+        started = time.perf_counter()
+        text = reader.pages[number].extract_text() or ""
+        pages.append((number, text, time.perf_counter() - started))
+    return pages
+
+def page_ranges(page_count: int, parts: int) -> List[Tuple[int, int]]:
+    """Sayfaları sırayı koruyarak en fazla `parts` adet ardışık aralığa böler"""
+    parts = max(1, min(parts, page_count))
+    size, remainder = divmod(page_count, parts)
+    ranges = []
+    start = 0
+    for part in range(parts):
+        stop = start + size + (1 if part < remainder else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+def extract_pdf_text(source: Source, executor: Optional[Executor] = None, parallel_min_pages: int = 12,
+                     workers: int = 4, max_chars: Optional[int] = None,
+                     range_timeout: Optional[float] = PAGE_RANGE_TIMEOUT) -> Dict:
+    """PDF metnini sayfa sırasıyla çıkarır.
+
+    Sayfa sayısı `parallel_min_pages` ve üzerindeyse sayfa aralıkları `executor` havuzuna dağıtılır;
+    küçük dosyalarda veya havuz kullanılamadığında seri çıkarma yapılır. Bir aralık `range_timeout`
+    içinde bitmez ya da hata verirse bekleyen aralıklar iptal edilip seri çıkarmaya dönülür; havuz
+    bozulduysa sonuçta "pool_broken" işaretlenir. Her sayfanın süresi raporlanır.
+    `max_chars` dolduğunda kalan sayfalar hiç işlenmez: paralel çıkarmada aralıklar işçi sayısı
+    kadarlık bir pencereyle gönderilir, sınır aşılınca yenileri gönderilmez ve bekleyenler iptal edilir.
+    """
+    started = time.perf_counter()
+    reader = PyPDF2.PdfReader(open_stream(source))
+    page_count = len(reader.pages)
+
+    pages = None
+    mode = "serial"
+    pool_broken = False
+    if executor is not None and workers > 1 and page_count >= parallel_min_pages:
+        futures = []
+        try:
+            # İşçi başına iki aralık: yavaş sayfalar tek bir işçide birikmesin
+            data = read_bytes(source)  # İşçilere gönderim için tek kopya
+            ranges = page_ranges(page_count, workers * 2)
+            window = len(ranges) if max_chars is None else workers
+            for start, stop in ranges[:window]:
+                futures.append(executor.submit(_extract_page_range, data, start, stop))
+            # Future'lar gönderim sırasıyla toplandığından sayfa sırası korunur
+            pages = []
+            extracted_chars = 0
+            for index, future in enumerate(futures):
+                chunk = future.result(timeout=range_timeout)
+                pages.extend(chunk)
+                extracted_chars += sum(len(text) + 1 for _, text, _ in chunk)
+                if max_chars is not None and extracted_chars > max_chars:
+                    for pending in futures[index + 1:]:
+                        pending.cancel()
+                    break
+                if len(futures) < len(ranges):
+                    start, stop = ranges[len(futures)]
+                    futures.append(executor.submit(_extract_page_range, data, start, stop))
+            mode = "parallel"
+        except Exception as e:
+            # Zaman aşımı, işçi hatası veya ölen işçi süreç: kuyruktaki aralıklar boşuna çalışmasın
+            for future in futures:
+                future.cancel()
+            pool_broken = isinstance(e, BrokenProcessPool)
+            pages = None
+            mode = "serial_fallback"
+
+    if pages is None:
+        pages = []
+        extracted_chars = 0
+        for number, page in enumerate(reader.pages):
+            if max_chars is not None and extracted_chars > max_chars:
+                break
+            page_started = time.perf_counter()
+            text = page.extract_text() or ""
+            pages.append((number, text, time.perf_counter() - page_started))
+            extracted_chars += len(text) + 1
+
+    text, truncated = _join_capped((text for _, text, _ in pages), max_chars)
+    cleaned_text, cleanup = clean_pdf_pages([text for _, text, _ in pages], page_count)
+    return {
+        "text": text,
+        "cleaned_text": cleaned_text[:max_chars] if max_chars is not None else cleaned_text,
+        "cleanup": cleanup,
+        "truncated": truncated or len(pages) < page_count,
+        "page_count": page_count,
+        "mode": mode,
+        "pool_broken": pool_broken,
+        "elapsed": time.perf_counter() - started,
+        "pages": [
+            {"page": number + 1, "seconds": seconds, "chars": len(text)}
+            for number, text, seconds in pages
+        ]
+    }
+
+def extract_docx_text(source: Source, max_chars: Optional[int] = None) -> Dict:
+    """DOCX paragraflarının metnini çıkarır; `max_chars` dolduğunda kalan paragraflar işlenmez"""
+    started = time.perf_counter()
+    document = docx.Document(open_stream(source))
+
+    paragraphs = []
+    extracted_chars = 0
+    truncated = False
+    for paragraph in document.paragraphs:
+        if max_chars is not None and extracted_chars > max_chars:
+            truncated = True
+            break
+        paragraphs.append(paragraph.text)
+        extracted_chars += len(paragraph.text) + 1
+
+    text, capped = _join_capped(paragraphs, max_chars)
+    return {
+        "text": text,
+        "truncated": truncated or capped,
+        "elapsed": time.perf_counter() - started
+    }
+
+
+MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+def _docx_paragraph_texts(element) -> List[str]:
+    """Bir XML öğesindeki tüm w:p paragraflarının metnini belge sırasıyla döndürür.
+
+    Tablo hücreleri ve metin kutuları da w:p içerdiğinden yakalanır; metin kutularının
+    eski biçimli (mc:Fallback) kopyaları atlanır, iç içe paragraflar ikinci kez sayılmaz.
+    """
+    texts = []
+    paragraph_tag = qn("w:p")
+    text_tag = qn("w:t")
+    tab_tag = qn("w:tab")
+    for paragraph in element.iter(paragraph_tag):
+        if any(ancestor.tag == MC_FALLBACK for ancestor in paragraph.iterancestors()):
+            continue
+        parts = []
+        for node in paragraph.iter(text_tag, tab_tag):
+            # İç içe paragrafın (metin kutusu) metni kendi satırında yazılır
+            if next(node.iterancestors(paragraph_tag)) is not paragraph:
+                continue
+            parts.append("\t" if node.tag == tab_tag else (node.text or ""))
+        texts.append("".join(parts))
+    return texts
+
+class ExtractorBackend:
+    """Metin çıkarma backend'i arayüzü.
+
+    Her backend tek bir dosya türüne (pdf/docx) hizmet eder ve `extract` ile en az
+    "text", "truncated" ve "elapsed" alanlarını içeren bir sözlük döndürür. PDF backend'leri
+    ayrıca temizlenmiş metni ("cleaned_text") ve temizleme istatistiklerini ("cleanup") döndürür.
+    """
+    name = ""
+    file_type = ""
+    description = ""
+
+    def available(self) -> bool:
+        """Backend'in bağımlılıkları kurulu mu"""
+        return True
+
+    def extract(self, source: Source, max_chars: Optional[int] = None, executor: Optional[Executor] = None,
+                parallel_min_pages: int = 12, workers: int = 4) -> Dict:
+        """Havuz parametreleri yalnızca sayfa paralel çalışabilen backend'lerce kullanılır"""
+        raise NotImplementedError
+
+class PyPDF2Backend(ExtractorBackend):
+    name = "pypdf2"
+    file_type = "pdf"
+    description = "PyPDF2 sayfa metni (hızlı, sayfa paralel)"
+
+    def extract(self, source, max_chars=None, executor=None, parallel_min_pages=12, workers=4):
+        return extract_pdf_text(source, executor=executor, parallel_min_pages=parallel_min_pages,
+                                workers=workers, max_chars=max_chars)
+
+class PdfMinerBackend(ExtractorBackend):
+    name = "pdfminer"
+    file_type = "pdf"
+    description = "pdfminer.six düzen analizi (sütun ve okuma sırası duyarlı, yavaş)"
+
+    def available(self):
+        return pdfminer_extract_pages is not None
+
+    def extract(self, source, max_chars=None, executor=None, parallel_min_pages=12, workers=4):
+        started = time.perf_counter()
+        pages = []
+        extracted_chars = 0
+        complete = True
+        layouts = pdfminer_extract_pages(open_stream(source), laparams=LAParams())
+        for number in itertools.count():
+            if max_chars is not None and extracted_chars > max_chars:
+                complete = False
+                break
+            # Sayfa ayrıştırma ve düzen analizi next() içinde yapılır; süre ondan önce başlar
+            page_started = time.perf_counter()
+            layout = next(layouts, None)
+            if layout is None:
+                break
+            text = "".join(element.get_text() for element in layout if isinstance(element, LTTextContainer))
+            pages.append((number, text, time.perf_counter() - page_started))
+            extracted_chars += len(text) + 1
+
+        # Erken durulduysa kalan sayfalar düzen analizi yapılmadan yalnızca sayfa ağacından sayılır
+        page_count = len(pages) if complete else sum(1 for _ in PDFPage.get_pages(open_stream(source)))
+        text, truncated = _join_capped((text for _, text, _ in pages), max_chars)
+        cleaned_text, cleanup = clean_pdf_pages([text for _, text, _ in pages], page_count)
+        return {
+            "text": text,
+            "cleaned_text": cleaned_text[:max_chars] if max_chars is not None else cleaned_text,
+            "cleanup": cleanup,
+            "truncated": truncated or len(pages) < page_count,
+            "page_count": page_count,
+            "mode": "serial",
+            "elapsed": time.perf_counter() - started,
+            "pages": [
+                {"page": number + 1, "seconds": seconds, "chars": len(text)}
+                for number, text, seconds in pages
+            ]
+        }
+
+class DocxParagraphBackend(ExtractorBackend):
+    name = "docx-paragraphs"
+    file_type = "docx"
+    description = "Yalnızca gövde paragrafları (tablo, üst/alt bilgi ve metin kutularını atlar)"
+
+    def extract(self, source, max_chars=None, executor=None, parallel_min_pages=12, workers=4):
+        return extract_docx_text(source, max_chars=max_chars)
+
+class DocxFullBackend(ExtractorBackend):
+    name = "docx-full"
+    file_type = "docx"
+    description = "Üst bilgi, gövde (tablolar ve metin kutuları dahil) ve alt bilgi, belge sırasıyla"
+
+    def extract(self, source, max_chars=None, executor=None, parallel_min_pages=12, workers=4):
+        started = time.perf_counter()
+        document = docx.Document(open_stream(source))
+
+        # Önceki bölüme bağlı üst/alt bilgiler aynı parçayı paylaşır; her parça bir kez okunur
+        headers, footers, seen_parts = [], [], set()
+        for section in document.sections:
+            for target, parts in ((headers, (section.header, section.first_page_header)),
+                                  (footers, (section.footer, section.first_page_footer))):
+                for part in parts:
+                    if part.is_linked_to_previous or id(part.part) in seen_parts:
+                        continue
+                    seen_parts.add(id(part.part))
+                    target.extend(_docx_paragraph_texts(part._element))
+
+        paragraphs = headers + _docx_paragraph_texts(document.element.body) + footers
+        text, truncated = _join_capped(paragraphs, max_chars)
+        return {
+            "text": text,
+            "truncated": truncated,
+            "elapsed": time.perf_counter() - started
+        }
+
+# Dosya türü -> backend adı -> backend; ilk sıradaki varsayılandır
+EXTRACTOR_BACKENDS = {
+    "pdf": {backend.name: backend for backend in (PyPDF2Backend(), PdfMinerBackend())},
+    "docx": {backend.name: backend for backend in (DocxParagraphBackend(), DocxFullBackend())}
+}
+
+def get_backend(file_type: str, name: Optional[str] = None) -> ExtractorBackend:
+    """İstenen backend'i döndürür; bulunamaz ya da kurulu değilse türün varsayılanına düşer"""
+    backends = EXTRACTOR_BACKENDS[file_type]
+    backend = backends.get(name)
+    if backend is None or not backend.available():
+        backend = next(iter(backends.values()))
+    return backend
+
+BENCHMARK_TOKEN_PATTERN = re.compile(r"\w+")
+
+def benchmark(corpus_dir: str, repeat: int = 1) -> Dict[str, Dict]:
+    """Klasördeki PDF/DOCX dosyalarını tüm kurulu backend'lerden geçirip hız, bellek ve kapsam ölçer.
+
+    Kapsam: bir dosyada tüm backend'lerin bulduğu benzersiz kelimelerin kaçını bu backend'in bulduğu.
+    Bellek: tracemalloc ile ölçülen Python tarafı tepe ayırma (C kütüphanelerinin belleği dahil değildir).
+    tracemalloc her ayırmayı izleyip çıkarmayı yavaşlattığından bellek, süre ölçümlerinden sonra
+    ayrı bir çalıştırmada ölçülür.
+    """
+    files = sorted(
+        os.path.join(corpus_dir, name) for name in os.listdir(corpus_dir)
+        if os.path.splitext(name)[1].lower().lstrip(".") in EXTRACTOR_BACKENDS
+    )
+    results = {}
+    for path in files:
+        file_type = os.path.splitext(path)[1].lower().lstrip(".")
+        with open(path, "rb") as corpus_file:
+            data = corpus_file.read()
+
+        file_tokens = {}
+        for backend in EXTRACTOR_BACKENDS[file_type].values():
+            if not backend.available():
+                continue
+            stats = results.setdefault(backend.name, {
+                "file_type": file_type, "files": 0, "failures": 0, "pages": 0, "seconds": 0.0,
+                "peak_bytes": 0, "chars": 0, "coverage_sum": 0.0
+            })
+            try:
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    result = backend.extract(data)
+                    stats["seconds"] += time.perf_counter() - started
+                tracemalloc.start()
+                try:
+                    backend.extract(data)
+                    stats["peak_bytes"] = max(stats["peak_bytes"], tracemalloc.get_traced_memory()[1])
+                finally:
+                    tracemalloc.stop()
+            except Exception:
+                stats["failures"] += 1
+                continue
+            stats["files"] += 1
+            stats["pages"] += result.get("page_count", 1) * repeat
+            stats["chars"] += len(result["text"])
+            file_tokens[backend.name] = set(BENCHMARK_TOKEN_PATTERN.findall(result["text"].lower()))
+
+        union = set().union(*file_tokens.values()) if file_tokens else set()
+        for name, tokens in file_tokens.items():
+            results[name]["coverage_sum"] += len(tokens) / len(union) if union else 1.0
+
+    for stats in results.values():
+        stats["pages_per_second"] = stats["pages"] / stats["seconds"] if stats["seconds"] else 0.0
+        stats["coverage"] = stats["coverage_sum"] / stats["files"] if stats["files"] else 0.0
+    return results
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="CV metin çıkarma backend'lerini karşılaştırır")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    bench = subcommands.add_parser("benchmark", help="Yerel bir CV klasörünü tüm backend'lerden geçirir")
+    bench.add_argument("corpus_dir", help="PDF/DOCX dosyalarının bulunduğu klasör")
+    bench.add_argument("--repeat", type=int, default=1, help="Her dosyanın kaç kez çıkarılacağı")
+    subcommands.add_parser("list", help="Backend'leri ve kurulu olup olmadıklarını listeler")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for file_type, backends in EXTRACTOR_BACKENDS.items():
+            for backend in backends.values():
+                status = "kurulu" if backend.available() else "kurulu değil"
+                print(f"{file_type:5} {backend.name:16} {status:13} {backend.description}")
+        return 0
+
+    results = benchmark(args.corpus_dir, args.repeat)
+    if not results:
+        print("Klasörde PDF/DOCX dosyası bulunamadı")
+        return 1
+    print(f"{'backend':16} {'tür':5} {'dosya':>5} {'hata':>5} {'sayfa/sn':>9} {'tepe MB':>8} {'karakter':>10} {'kapsam':>7}")
+    for name, stats in sorted(results.items(), key=lambda item: (item[1]["file_type"], item[0])):
+        print(f"{name:16} {stats['file_type']:5} {stats['files']:>5} {stats['failures']:>5} "
+              f"{stats['pages_per_second']:>9.1f} {stats['peak_bytes'] / 1024 / 1024:>8.1f} "
+              f"{stats['chars']:>10} {stats['coverage']:>6.1%}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
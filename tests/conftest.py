@@ -0,0 +1,17 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    """Model sağlıklı görünen, yanıt önbelleğine yazmayan bir ATSAnalyzer"""
+    import app
+
+    instance = app.ATSAnalyzer()
+    monkeypatch.setattr(instance, "check_model_health", lambda: {"status": "healthy", "message": ""})
+    monkeypatch.setattr(instance.response_cache, "set", lambda *args, **kwargs: None)
+    return instance
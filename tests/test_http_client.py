@@ -0,0 +1,74 @@
+from io import BytesIO
+
+import pytest
+import requests
+
+from app import ModelHTTPClient
+
+URL = "http://127.0.0.1:1234/v1/chat/completions"
+
+
+class FakeSession:
+    def request(self, method, url, **kwargs):
+        response = requests.Response()
+        response.raw = BytesIO(b"")
+        return response
+
+
+@pytest.fixture
+def client(monkeypatch):
+    instance = ModelHTTPClient(endpoint_limits={"/v1/chat/completions": 1})
+    monkeypatch.setattr(instance, "_session", lambda: FakeSession())
+    return instance
+
+
+def test_streamed_response_holds_slot_until_closed(client):
+    response = client.post(URL, stream=True, timeout=5)
+    with pytest.raises(requests.exceptions.Timeout):
+        client.post(URL, timeout=0.01)
+
+    response.close()
+    response.close()  # ikinci close yeri iki kez bırakmamalı
+    client.post(URL, timeout=0.01)
+    client.post(URL, stream=True, timeout=0.01).close()
+
+
+def test_plain_response_releases_slot_immediately(client):
+    client.post(URL, timeout=5)
+    client.post(URL, timeout=0.01)
+
+
+def test_failed_request_releases_slot(client, monkeypatch):
+    class FailingSession:
+        def request(self, method, url, **kwargs):
+            raise requests.exceptions.ConnectionError("bağlantı yok")
+
+    monkeypatch.setattr(client, "_session", lambda: FailingSession())
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.post(URL, stream=True, timeout=5)
+    monkeypatch.setattr(client, "_session", lambda: FakeSession())
+    client.post(URL, timeout=0.01)
+
+
+def test_health_probe_lists_models_instead_of_generating():
+    from app import ModelHealthMonitor
+
+    class RecordingClient:
+        def __init__(self):
+            self.calls = []
+
+        def get(self, url, **kwargs):
+            self.calls.append(("GET", url))
+            response = requests.Response()
+            response.status_code = 404 if url.endswith("/health") else 200
+            return response
+
+        def post(self, url, **kwargs):
+            self.calls.append(("POST", url))
+            raise AssertionError("sağlık kontrolü üretim isteği göndermemeli")
+
+    client = RecordingClient()
+    monitor = ModelHealthMonitor("http://127.0.0.1:1234", client)
+
+    assert monitor._probe()["status"] == "healthy"
+    assert client.calls == [("GET", "http://127.0.0.1:1234/health"), ("GET", "http://127.0.0.1:1234/v1/models")]
@@ -0,0 +1,40 @@
+import pytest
+
+from app import rebuild_invalid_indexes
+
+CREATE = "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_test ON resumes (sector)"
+
+
+class FakeCursor:
+    """indisvalid sorgusuna sırayla verilen durumları döndüren cursor"""
+
+    def __init__(self, validity):
+        self.validity = list(validity)
+        self.executed = []
+        self.row = None
+
+    def execute(self, statement, params=None):
+        self.executed.append(statement)
+        if "pg_index" in statement:
+            self.row = (not self.validity.pop(0),)
+
+    def fetchone(self):
+        return self.row
+
+
+def test_invalid_index_is_dropped_and_rebuilt():
+    cursor = FakeCursor([False, True])
+    assert rebuild_invalid_indexes(cursor, [CREATE, "DROP INDEX CONCURRENTLY IF EXISTS idx_old"]) == ["idx_test"]
+    assert "DROP INDEX CONCURRENTLY IF EXISTS idx_test" in cursor.executed
+    assert cursor.executed.count(CREATE) == 1
+
+
+def test_valid_index_is_left_alone():
+    cursor = FakeCursor([True])
+    assert rebuild_invalid_indexes(cursor, [CREATE]) == []
+    assert len(cursor.executed) == 1
+
+
+def test_index_still_invalid_after_rebuild_fails_migration():
+    with pytest.raises(RuntimeError):
+        rebuild_invalid_indexes(FakeCursor([False, False]), [CREATE])
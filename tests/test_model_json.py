@@ -0,0 +1,55 @@
+import json
+
+from app import IncrementalJSONSectionParser, parse_model_json
+
+
+def test_parser_emits_members_as_they_complete():
+    parser = IncrementalJSONSectionParser()
+    assert parser.feed('Yanıt: {"overall_ats_score": 7') == []
+    assert parser.feed('0, "strengths": ["a", "b"') == [("overall_ats_score", 70)]
+    assert parser.feed('], "section_analysis": {"skills": {"score": 8}}') == [
+        ("strengths", ["a", "b"]), ("section_analysis", {"skills": {"score": 8}})
+    ]
+    assert not parser.finished
+    assert parser.feed('}') == []
+    assert parser.finished
+
+
+def test_parser_ignores_braces_and_commas_inside_strings():
+    parser = IncrementalJSONSectionParser()
+    members = parser.feed('{"details": "a, {b} [c] \\"d,\\"", "score": 5}')
+    assert members == [("details", 'a, {b} [c] "d,"'), ("score", 5)]
+    assert parser.finished
+
+
+def test_parser_handles_single_character_chunks():
+    text = json.dumps({"a": 1, "b": {"c": [1, 2]}, "d": "x,y"}, ensure_ascii=False)
+    parser = IncrementalJSONSectionParser()
+    members = [member for ch in text for member in parser.feed(ch)]
+    assert dict(members) == {"a": 1, "b": {"c": [1, 2]}, "d": "x,y"}
+
+
+def test_parse_complete_json_is_not_repaired():
+    assert parse_model_json('Sonuç: {"score": 80} teşekkürler') == ({"score": 80}, False)
+
+
+def test_parse_truncated_json_is_repaired():
+    result, repaired = parse_model_json('{"score": 80, "strengths": ["iyi özet", "net dil"], "weak')
+    assert repaired
+    assert result == {"score": 80, "strengths": ["iyi özet", "net dil"]}
+
+
+def test_parse_truncated_inside_string_and_nested_object():
+    result, repaired = parse_model_json('{"score": 60, "section": {"skills": {"details": "Python, Dja')
+    assert repaired
+    assert result["score"] == 60
+
+
+def test_parse_trailing_comma_is_repaired():
+    result, repaired = parse_model_json('{"items": [1, 2,], "score": 3,}')
+    assert repaired
+    assert result == {"items": [1, 2], "score": 3}
+
+
+def test_parse_without_json_returns_none():
+    assert parse_model_json("Model yanıt veremedi") == (None, False)
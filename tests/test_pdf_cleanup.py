@@ -0,0 +1,66 @@
+from extractors import clean_pdf_pages
+
+BODY = "Yazılım Mühendisi\nPython ve PostgreSQL ile servis geliştirme\nKod incelemesi ve test otomasyonu\nCI/CD süreçleri\n"
+BODIES = [
+    BODY,
+    "Veri Analisti\nSQL raporları ve panolar\nA/B testleri\nTalep tahmini modelleri\n",
+    "Proje Yöneticisi\nScrum ekiplerinin koordinasyonu\nBütçe takibi\nPaydaş raporları\n",
+]
+
+def test_single_page_keeps_year_at_edge():
+    text, stats = clean_pdf_pages(["Ahmet Yılmaz\n" + BODY + "ABC Ltd\n2019"])
+    assert text.rstrip().endswith("ABC Ltd\n2019")
+    assert stats["removed_page_numbers"] == 0
+
+def test_open_date_ranges_at_page_edges_are_kept():
+    pages = ["2019 -\n" + BODY + "XYZ A.Ş.", "- 2021\n" + BODY + "DEF Ltd"]
+    text, stats = clean_pdf_pages(pages)
+    assert "2019 -" in text
+    assert "- 2021" in text
+    assert stats["removed_page_numbers"] == 0
+
+def test_same_year_on_every_page_is_not_a_page_number():
+    pages = [body + "2020" for body in BODIES]
+    text, stats = clean_pdf_pages(pages)
+    assert text.count("2020") == 3
+    assert stats["removed_page_numbers"] == 0
+    assert stats["removed_repeated_lines"] == 0
+
+def test_bare_page_sequence_is_removed():
+    pages = [BODY + "Proje A\n1", BODY + "Proje B\n2", BODY + "Proje C\n- 3 -"]
+    text, stats = clean_pdf_pages(pages)
+    assert stats["removed_page_numbers"] == 3
+    assert "\n1\n" not in text and "- 3 -" not in text
+    assert "Proje C" in text
+
+def test_bare_numbers_without_sequence_are_kept():
+    pages = [BODY + "Ekip\n12", BODY + "Müşteri\n40"]
+    text, stats = clean_pdf_pages(pages)
+    assert "12" in text and "40" in text
+    assert stats["removed_page_numbers"] == 0
+
+def test_marked_page_numbers_are_removed():
+    text, stats = clean_pdf_pages(["Sayfa 1\n" + BODY + "Referanslar", BODY + "Eğitim\n2/2"])
+    assert "Sayfa" not in text and "2/2" not in text
+    assert stats["removed_page_numbers"] + stats["removed_repeated_lines"] == 2
+
+def test_month_year_dates_are_not_page_markers():
+    pages = [BODIES[0] + "09/2019", BODIES[1] + "03/2021"]
+    text, stats = clean_pdf_pages(pages)
+    assert "09/2019" in text and "03/2021" in text
+    assert stats["removed_page_numbers"] == 0
+    assert stats["removed_repeated_lines"] == 0
+
+def test_fraction_must_match_page_count():
+    text, _ = clean_pdf_pages([BODY + "Proje\n3/4"], page_count=4)
+    assert "3/4" not in text
+    text, _ = clean_pdf_pages([BODY + "Başarı\n3/4"])
+    assert "3/4" in text
+
+def test_repeated_footer_and_hyphenation():
+    pages = ["Ahmet Yılmaz - CV\n" + BODY + "geliş-\ntirme", "Ahmet Yılmaz - CV\n" + BODY + "Eğitim"]
+    text, stats = clean_pdf_pages(pages)
+    assert "Ahmet Yılmaz - CV" not in text
+    assert "geliştirme" in text
+    assert stats["removed_repeated_lines"] == 2
+    assert stats["joined_hyphenations"] == 1
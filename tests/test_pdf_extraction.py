@@ -0,0 +1,103 @@
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+
+import PyPDF2
+import pytest
+
+from extractors import PdfMinerBackend, extract_pdf_text
+
+
+def blank_pdf(pages):
+    writer = PyPDF2.PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=200, height=200)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+class FakeExecutor:
+    """İlk aralığın sonucunu `first` ile belirleyen, diğerlerini bekleyen bırakan havuz"""
+
+    def __init__(self, first):
+        self.first = first
+        self.futures = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        if not self.futures:
+            self.first(future)
+        self.futures.append(future)
+        return future
+
+
+def test_broken_pool_falls_back_and_cancels_pending_ranges():
+    executor = FakeExecutor(lambda future: future.set_exception(BrokenProcessPool("işçi öldü")))
+    result = extract_pdf_text(blank_pdf(4), executor=executor, parallel_min_pages=2, workers=2)
+
+    assert result["mode"] == "serial_fallback"
+    assert result["pool_broken"] is True
+    assert result["page_count"] == 4 and len(result["pages"]) == 4
+    assert all(future.cancelled() for future in executor.futures[1:])
+
+
+def test_worker_error_does_not_mark_pool_broken():
+    executor = FakeExecutor(lambda future: future.set_exception(ValueError("bozuk sayfa")))
+    result = extract_pdf_text(blank_pdf(4), executor=executor, parallel_min_pages=2, workers=2)
+
+    assert result["mode"] == "serial_fallback"
+    assert result["pool_broken"] is False
+
+
+def test_range_timeout_falls_back_to_serial():
+    executor = FakeExecutor(lambda future: None)  # hiçbir aralık bitmiyor
+    result = extract_pdf_text(blank_pdf(4), executor=executor, parallel_min_pages=2, workers=2, range_timeout=0.01)
+
+    assert result["mode"] == "serial_fallback"
+    assert result["pool_broken"] is False
+    assert all(future.cancelled() for future in executor.futures)
+
+
+class ImmediateExecutor:
+    """Gönderilen aralığı hemen çalıştıran havuz"""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn, *args):
+        self.submitted.append(args[1:])
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+def test_parallel_extraction_stops_submitting_at_max_chars():
+    executor = ImmediateExecutor()
+    result = extract_pdf_text(blank_pdf(20), executor=executor, parallel_min_pages=2, workers=2, max_chars=2)
+
+    assert result["mode"] == "parallel"
+    assert executor.submitted == [(0, 5), (5, 10)]  # ilk pencere; sınır aşıldıktan sonra yeni aralık yok
+    assert len(result["pages"]) == 5
+    assert result["truncated"] is True
+
+
+def test_parallel_extraction_without_cap_reads_every_page():
+    executor = ImmediateExecutor()
+    result = extract_pdf_text(blank_pdf(20), executor=executor, parallel_min_pages=2, workers=2)
+
+    assert len(executor.submitted) == 4
+    assert [page["page"] for page in result["pages"]] == list(range(1, 21))
+
+
+@pytest.mark.skipif(not PdfMinerBackend().available(), reason="pdfminer.six kurulu değil")
+def test_pdfminer_backend_counts_pages_without_pypdf2(monkeypatch):
+    data = blank_pdf(4)
+    monkeypatch.setattr(PyPDF2, "PdfReader", None)
+
+    full = PdfMinerBackend().extract(data)
+    assert full["page_count"] == 4 and len(full["pages"]) == 4
+
+    capped = PdfMinerBackend().extract(data, max_chars=0)
+    assert capped["page_count"] == 4 and len(capped["pages"]) == 1
+    assert capped["truncated"] is True
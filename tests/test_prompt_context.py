@@ -0,0 +1,40 @@
+from app import resume_prompt_context
+
+RESUME = """Ayşe Demir
+İstanbul, Türkiye
+ayse.demir@example.com | 0532 123 45 67
+Sekiz yıllık deneyime sahip backend geliştirici; ödeme sistemleri ve dağıtık servisler.
+
+İŞ DENEYİMİ
+Kıdemli Yazılım Mühendisi - ABC Teknoloji (2019 - 2024)
+Ödeme altyapısını Python ile yeniden yazdım.
+
+REFERANSLAR
+Talep üzerine verilecektir.
+
+EĞİTİM
+Bilgisayar Mühendisliği, ODTÜ (2012 - 2016)
+"""
+
+def test_header_region_is_kept():
+    context = resume_prompt_context(RESUME)
+    assert context.startswith("Ayşe Demir\nİstanbul, Türkiye")
+    assert "backend geliştirici" in context
+    assert "İLETİŞİM: E-posta: ayse.demir@example.com" in context
+
+def test_unrecognized_headings_are_passed_through():
+    context = resume_prompt_context(RESUME, include_contact=False)
+    assert "REFERANSLAR\nTalep üzerine verilecektir." in context
+    assert "İLETİŞİM" not in context
+    assert "Ayşe Demir" in context
+
+def test_section_filter_keeps_unheaded_summary_only_when_requested():
+    experience_only = resume_prompt_context(RESUME, ["experience"], include_contact=False)
+    assert "Ayşe Demir" not in experience_only
+    assert "ODTÜ" not in experience_only
+    with_summary = resume_prompt_context(RESUME, ["summary", "experience"], include_contact=False)
+    assert "backend geliştirici" in with_summary
+
+def test_unsegmented_text_is_returned_as_is():
+    text = "Ayşe Demir\nPython geliştirici"
+    assert resume_prompt_context(text) == text
@@ -0,0 +1,47 @@
+import time
+
+import app
+from app import LLMResponseCache, should_persist_result
+
+
+class FakeDatabaseManager:
+    def __init__(self, rows=None):
+        self.rows = rows or {}  # cache_key -> (yanıt, kalan süre)
+        self.saved = []
+        self.evictions = 0
+
+    def get_cached_llm_response(self, cache_key):
+        return self.rows.get(cache_key, ({}, 0))
+
+    def save_cached_llm_response(self, cache_key, analysis_type, response, ttl):
+        self.saved.append(cache_key)
+        return True
+
+    def evict_llm_response_cache(self, max_rows):
+        self.evictions += 1
+        return 0
+
+
+def test_database_hit_keeps_database_expiry():
+    db = FakeDatabaseManager({"anahtar": ({"overall_ats_score": 70}, 30.0)})
+    cache = LLMResponseCache(db, ttl=7 * 24 * 3600)
+
+    assert cache.get("anahtar") == {"overall_ats_score": 70}
+    expires_at = cache._memory["anahtar"][0]
+    assert expires_at - time.time() <= 30
+
+
+def test_database_eviction_runs_periodically(monkeypatch):
+    monkeypatch.setattr(app, "LLM_CACHE_EVICT_INTERVAL", 3600)
+    db = FakeDatabaseManager()
+    cache = LLMResponseCache(db)
+    for number in range(5):
+        cache.set(f"anahtar-{number}", "ats", {"overall_ats_score": number})
+
+    assert len(db.saved) == 5
+    assert db.evictions == 1
+
+
+def test_cached_results_are_not_saved_again():
+    assert should_persist_result({"overall_ats_score": 70})
+    assert not should_persist_result({"overall_ats_score": 70, "from_cache": True})
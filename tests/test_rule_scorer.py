@@ -0,0 +1,75 @@
+import pytest
+
+from app import RuleBasedScorer, SectorKeywordIndex, match_fold
+
+SECTORS = {
+    "teknoloji": {"keywords": ["c++", "c#", "node.js", "java", "javascript", "python", "sql", "docker"]},
+    "finans": {"keywords": ["muhasebe", "bütçe", "risk analizi"]},
+    "genel": {"keywords": []},
+}
+
+RESUME = """Ayşe Demir
+ayse@example.com | 0532 123 45 67 | linkedin.com/in/ayse
+PROFESYONEL ÖZET
+C++ ve Python ile 6 yıl deneyimli yazılım geliştirici.
+İŞ DENEYİMİ
+- Ödeme servisini geliştirdim, gecikmeyi %40 azalttım (2019 - 2024)
+- Node.js ile REST API tasarladım
+EĞİTİM
+Bilgisayar Mühendisliği Lisans, ODTÜ (2014 - 2018)
+BECERİLER
+C#, C++, Python, Docker
+"""
+
+
+@pytest.fixture
+def scorer():
+    return RuleBasedScorer(SECTORS, SectorKeywordIndex(SECTORS))
+
+
+@pytest.mark.parametrize("text, keyword", [
+    ("c++ ve python", "c++"),
+    ("deneyim: c#, sql", "c#"),
+    ("node.js.", "node.js"),
+    ("(c++)", "c++"),
+])
+def test_keywords_ending_in_symbols_are_matched(text, keyword):
+    index = SectorKeywordIndex(SECTORS)
+    assert index.count_keywords(match_fold(text))[keyword] == 1
+
+
+def test_keywords_are_not_matched_inside_words():
+    counts = SectorKeywordIndex(SECTORS).count_keywords(match_fold("javascript geliştirici, abc++ değil"))
+    assert counts["javascript"] == 1
+    assert counts["java"] == 0
+    assert counts["c++"] == 0
+
+
+def test_score_resume(scorer):
+    result = scorer.score_resume(RESUME, "teknoloji")
+
+    assert 0 <= result["overall_ats_score"] <= 100
+    assert result["section_analysis"]["contact_info"]["score"] == 100
+    found = result["keyword_analysis"]["industry_keywords"]
+    assert {"c++", "c#", "node.js", "python", "docker"} <= set(found)
+    assert "java" in result["keyword_analysis"]["missing_keywords"]
+    assert "c++" not in result["keyword_analysis"]["missing_keywords"]
+
+
+def test_score_resume_penalizes_missing_sections(scorer):
+    full = scorer.score_resume(RESUME, "teknoloji")["overall_ats_score"]
+    sparse = scorer.score_resume("Ayşe Demir\nYazılım geliştirici", "teknoloji")
+    assert sparse["overall_ats_score"] < full
+    assert sparse["section_analysis"]["contact_info"]["missing_elements"]
+
+
+def test_score_job_match(scorer):
+    job = "C++ ve C# bilen, Node.js ile çalışmış, Java tecrübeli geliştirici. Lisans mezunu, 3 yıl deneyim."
+    result = scorer.score_job_match(RESUME, job, "teknoloji")
+
+    keywords = result["detailed_analysis"]["keyword_analysis"]
+    assert set(keywords["matched_keywords"]) == {"c++", "c#", "node.js"}
+    assert keywords["missing_critical_keywords"] == ["java"]
+    assert keywords["keyword_match_percentage"] == 75
+    assert result["scoring_engine"] == "rule_based"
+    assert 0 <= result["overall_match_score"] <= 100
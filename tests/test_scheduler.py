@@ -0,0 +1,28 @@
+import threading
+
+from app import ModelRequestScheduler
+
+
+def test_wait_callback_runs_without_holding_scheduler_lock():
+    scheduler = ModelRequestScheduler(max_concurrency=1, max_queue=4, queue_timeout=5)
+    other_thread_done = []
+    finished_during_callback = []
+
+    def on_wait(position, waiting):
+        # Başka bir oturumun kuyruk işlemi geri çağrı sürerken engellenmemeli
+        worker = threading.Thread(target=lambda: other_thread_done.append(scheduler.snapshot()))
+        worker.start()
+        worker.join(timeout=1)
+        finished_during_callback.append(not worker.is_alive())
+        release.set()
+
+    release = threading.Event()
+    with scheduler.slot():
+        waiter = threading.Thread(target=scheduler._acquire, args=(0, on_wait))
+        waiter.start()
+        release.wait(timeout=2)
+    waiter.join(timeout=2)
+
+    assert finished_during_callback == [True]
+    assert other_thread_done[0]["waiting"] == 1
+    assert scheduler.snapshot()["active"] == 1  # bekleyen istek slot'u aldı
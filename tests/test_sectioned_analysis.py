@@ -0,0 +1,31 @@
+import threading
+import time
+
+from app import ATS_PART_PRIORITY, ATS_SECTION_PROMPTS
+
+
+def test_parts_run_once_at_low_priority_within_model_concurrency(analyzer, monkeypatch):
+    calls = []
+    running = [0, 0]  # (şu an çalışan, en yüksek)
+    lock = threading.Lock()
+
+    def fake_call(prompt, max_tokens=1000, priority=0, response_schema=None):
+        with lock:
+            calls.append(priority)
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        if "Anahtar kelime analizi" in prompt:
+            return "geçersiz yanıt"
+        return '{"overall_ats_score": 72}'
+
+    monkeypatch.setattr(analyzer, "call_local_model", fake_call)
+    result = analyzer.analyze_resume_ats_score_sectioned("Deneyim\nYazılım geliştirici\nEğitim\nODTÜ", use_cache=False)
+
+    assert len(calls) == len(ATS_SECTION_PROMPTS)  # ayrıştırılamayan kısım ikinci kez denenmez
+    assert set(calls) == {ATS_PART_PRIORITY}
+    assert running[1] <= analyzer.scheduler.max_concurrency
+    assert result["overall_ats_score"] == 72
+    assert result["failed_sections"] == [ATS_SECTION_PROMPTS["keyword_analysis"]["title"]]
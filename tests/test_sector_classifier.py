@@ -0,0 +1,24 @@
+from app import get_batch_sector_classifier
+
+TEXTS = [
+    "Python, Django ve PostgreSQL ile REST API geliştirdim. Docker ve Kubernetes kullandım.",
+    "BANKACILIK sektöründe risk analizi, bütçe ve finansal raporlama deneyimi.",
+    "Hemşire olarak hasta bakımı ve sağlık yönetimi alanında çalıştım.",
+    "Öğretmen; müfredat hazırlama ve sınıf yönetimi.",
+    "Dijital pazarlama, SEO ve sosyal medya kampanyaları yönettim.",
+    "Satış hedeflerini aştım, müşteri ilişkileri ve CRM kullanımı.",
+    "Java geliştirici; ayrıca muhasebe ve finans ekipleriyle çalıştım.",
+    "Hobilerim: yüzme, satranç ve seyahat.",
+    "",
+]
+
+def test_batch_classifier_matches_detect_sector(analyzer):
+    classifier = get_batch_sector_classifier()
+    assert classifier.classify(TEXTS) == [analyzer.detect_sector(text) for text in TEXTS]
+
+def test_classification_does_not_depend_on_batch(analyzer):
+    classifier = get_batch_sector_classifier()
+    together = classifier.classify(TEXTS)
+    one_by_one = [classifier.classify([text])[0] for text in TEXTS]
+    assert together == one_by_one
+    assert (classifier.score(TEXTS)[:2] == classifier.score(TEXTS[:2])).all()
@@ -0,0 +1,88 @@
+import requests
+
+from app import should_persist_result
+
+
+def _run_stream(analyzer, monkeypatch, chunks, error=None):
+    def fake_stream(*args, **kwargs):
+        yield from chunks
+        if error is not None:
+            raise error
+
+    monkeypatch.setattr(analyzer, "stream_local_model", fake_stream)
+    return list(analyzer.analyze_resume_ats_score_stream("Deneyim\nYazılım geliştirici", use_cache=False))
+
+
+def test_interrupted_stream_is_marked_incomplete(analyzer, monkeypatch):
+    results = _run_stream(
+        analyzer, monkeypatch,
+        ['{"overall_ats_score": 70, "keyword_analysis": {"missing": []}, "section_analysis": {"con'],
+        error=requests.exceptions.ConnectionError("bağlantı koptu")
+    )
+
+    final = results[-1]
+    assert final["overall_ats_score"] == 70
+    assert final["incomplete"] is True
+    assert "bağlantı koptu" in final["incomplete_reason"]
+    assert "in_progress" not in final
+    assert not should_persist_result(final)
+
+
+def test_stream_ending_before_closing_brace_is_incomplete(analyzer, monkeypatch):
+    final = _run_stream(analyzer, monkeypatch, ['{"overall_ats_score": 55, "keyword_analysis": {}, '])[-1]
+
+    assert final["incomplete"] is True
+    assert not should_persist_result(final)
+
+
+def test_finished_stream_is_persisted(analyzer, monkeypatch):
+    final = _run_stream(analyzer, monkeypatch, ['{"overall_ats_score": 80,', ' "keyword_analysis": {}}'])[-1]
+
+    assert final == {"overall_ats_score": 80, "keyword_analysis": {}}
+    assert should_persist_result(final)
+
+
+class FakeStreamResponse:
+    def __init__(self, status_code, lines=()):
+        self.status_code = status_code
+        self.text = "response_format desteklenmiyor" if status_code == 400 else ""
+        self.lines = lines
+        self.closed = False
+
+    def iter_lines(self, decode_unicode=False):
+        return iter(self.lines)
+
+    def close(self):
+        self.closed = True
+
+
+def test_stream_retries_without_schema_on_http_400(analyzer, monkeypatch):
+    rejected = FakeStreamResponse(400)
+    accepted = FakeStreamResponse(200, ['data: {"choices": [{"delta": {"content": "{}"}}]}', "data: [DONE]"])
+    responses = [rejected, accepted]
+    payloads = []
+
+    def fake_post(url, json=None, **kwargs):
+        payloads.append(json)
+        return responses.pop(0)
+
+    monkeypatch.setattr(analyzer.http_client, "post", fake_post)
+    tokens = list(analyzer._stream_chat_completion("prompt", 100, response_schema={"type": "object"}))
+
+    assert tokens == ["{}"]
+    assert "response_format" in payloads[0]
+    assert "response_format" not in payloads[1]
+    assert rejected.closed and accepted.closed
+
+
+def test_repaired_response_is_not_cached(analyzer, monkeypatch):
+    cached = []
+    monkeypatch.setattr(analyzer.response_cache, "set", lambda *args: cached.append(args))
+    monkeypatch.setattr(analyzer, "call_local_model", lambda *args, **kwargs: '{"overall_ats_score": 60, "strengths": ["a"')
+
+    result = analyzer.analyze_resume_ats_score("Deneyim\nYazılım geliştirici", use_cache=False)
+
+    assert result["overall_ats_score"] == 60
+    assert result["repaired_response"] is True
+    assert not should_persist_result(result)
+    assert cached == []